@@ -2,6 +2,212 @@ from math import inf, nan
 fs = frozenset
 Real = {float, int}
 
+class VertexSet(set):
+    """It is the set of vertices of a graph, which keeps a version number incremented at each of its modifications
+    It allows a graph to know whether its cached properties are still valid
+    """
+
+    def __init__(self, Vertices = ()):
+        super().__init__(Vertices)
+        self.version = 0
+
+    def modified(self, result = None):
+        """It increments the version of self, and returns 'result'"""
+        self.version += 1
+        return result
+
+    def add(self, vertex):
+        return self.modified(super().add(vertex))
+
+    def clear(self):
+        return self.modified(super().clear())
+
+    def difference_update(self, *Others):
+        return self.modified(super().difference_update(*Others))
+
+    def discard(self, vertex):
+        return self.modified(super().discard(vertex))
+
+    def intersection_update(self, *Others):
+        return self.modified(super().intersection_update(*Others))
+
+    def pop(self):
+        return self.modified(super().pop())
+
+    def remove(self, vertex):
+        return self.modified(super().remove(vertex))
+
+    def symmetric_difference_update(self, Other):
+        return self.modified(super().symmetric_difference_update(Other))
+
+    def update(self, *Others):
+        return self.modified(super().update(*Others))
+
+    def __iand__(self, Other):
+        return self.modified(super().__iand__(Other))
+
+    def __ior__(self, Other):
+        return self.modified(super().__ior__(Other))
+
+    def __isub__(self, Other):
+        return self.modified(super().__isub__(Other))
+
+    def __ixor__(self, Other):
+        return self.modified(super().__ixor__(Other))
+
+    def __reduce__(self):
+        #The vertices are given back to __init__(), so that copy and pickle restore a consistent VertexSet
+        return VertexSet, (set(self),), {'version': self.version}
+
+    def __repr__(self):
+        return repr(set(self))
+
+class WeightList(list):
+    """It is the list of weights of an edge stored in an 'EdgeDict' (its owner), which it warns at each of its modifications
+    Thus, the lists of weights of a graph can be modified in place (ex: G.Edges[Edge].append(2)) without making its counters or its cached properties wrong
+    """
+
+    def __init__(self, Weights = (), Owner = None, Edge = None):
+        super().__init__(Weights)
+        self.Owner = Owner
+        self.Edge = Edge
+
+    def modified(self, method, *args):
+        """It applies the list method 'method' to self with 'args', and updates the counters and the version of the owner of self, if there is one"""
+        if self.Owner is None:
+            return method(self, *args)
+        self.Owner.count(self.Edge, self, -1)
+        result = method(self, *args)
+        self.Owner.count(self.Edge, self, 1)
+        self.Owner.version += 1
+        return result
+
+    def append(self, weight):
+        return self.modified(list.append, weight)
+
+    def clear(self):
+        return self.modified(list.clear)
+
+    def extend(self, Weights):
+        return self.modified(list.extend, Weights)
+
+    def insert(self, i, weight):
+        return self.modified(list.insert, i, weight)
+
+    def pop(self, *i):
+        return self.modified(list.pop, *i)
+
+    def remove(self, weight):
+        return self.modified(list.remove, weight)
+
+    def __delitem__(self, i):
+        return self.modified(list.__delitem__, i)
+
+    def __iadd__(self, Weights):
+        return self.modified(list.__iadd__, Weights)
+
+    def __imul__(self, n):
+        return self.modified(list.__imul__, n)
+
+    def __reduce__(self):
+        #A copy of a list of weights has no owner
+        return list, (list(self),)
+
+    def __setitem__(self, i, weight):
+        return self.modified(list.__setitem__, i, weight)
+
+class EdgeDict(dict):
+    """It is the dict of edges of a graph, which keeps a version number incremented at each of its modifications, and some counters updated in O(1) :
+    - nArcs : the number of arcs (oriented edges) between 2 different vertices
+    - nLoops : the number of loops
+    - nMulti : the number of edges which have a number (or a list of weights) greater than 1
+    - nPairs : the number of non oriented edges between 2 different vertices
+    NB: each key is counted once, whatever its number (or list of weights) is
+    Rk: the lists of weights are stored in 'WeightList', which warn self when they are modified in place (ex: 'G.Edges[Edge].append(2)')
+    """
+
+    def __init__(self, Edges = {}):
+        super().__init__()
+        self.version = 0
+        self.nArcs = self.nLoops = self.nMulti = self.nPairs = 0
+        self.update(Edges)
+
+    def count(self, Edge, val, sign:int):
+        """It adds 'sign' (1 or -1) to the counters concerned by the edge 'Edge' of number (or list of weights) 'val'"""
+        if type(Edge) not in {fs, tuple}:
+            return #Such an edge is rejected by Graph.isGraph()
+        if len(Edge) == 1:
+            self.nLoops += sign
+        elif type(Edge) == tuple:
+            self.nArcs += sign
+        else:
+            self.nPairs += sign
+        if (type(val) == int and val > 1) or (type(val) in {list, WeightList} and len(val) > 1):
+            self.nMulti += sign
+
+    def clear(self):
+        for val in self.values():
+            self.release(val)
+        super().clear()
+        self.nArcs = self.nLoops = self.nMulti = self.nPairs = 0
+        self.version += 1
+
+    def pop(self, Edge, *default):
+        if Edge in self:
+            self.count(Edge, self[Edge], -1)
+            self.release(self[Edge])
+            self.version += 1
+        return super().pop(Edge, *default)
+
+    def popitem(self):
+        Edge, val = super().popitem()
+        self.count(Edge, val, -1)
+        self.release(val)
+        self.version += 1
+        return Edge, val
+
+    def release(self, val):
+        """It detaches the eventual list of weights 'val' from self, once it has been removed from self"""
+        if type(val) == WeightList and val.Owner is self:
+            val.Owner = None
+
+    def setdefault(self, Edge, default = None):
+        if Edge not in self:
+            self[Edge] = default
+        return self[Edge]
+
+    def update(self, *Others, **kwargs):
+        for Edge, val in dict(*Others, **kwargs).items():
+            self[Edge] = val
+
+    def __delitem__(self, Edge):
+        self.count(Edge, self[Edge], -1)
+        self.release(self[Edge])
+        super().__delitem__(Edge)
+        self.version += 1
+
+    def __ior__(self, Other):
+        self.update(Other)
+        return self
+
+    def __reduce__(self):
+        #The edges are given back to __init__(), which rebuilds the counters, instead of being replayed through __setitem__() on the restored ones
+        return EdgeDict, (dict(self),), {'version': self.version}
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __setitem__(self, Edge, val):
+        if Edge in self:
+            self.count(Edge, self[Edge], -1)
+            if self[Edge] is not val:
+                self.release(self[Edge])
+        if type(val) in {list, WeightList} and not (type(val) == WeightList and val.Owner is self and val.Edge == Edge):
+            val = WeightList(val, self, Edge) #Case of 'G.Edges[Edge] += [2]' excluded, where val is already the list of weights of Edge
+        super().__setitem__(Edge, val)
+        self.count(Edge, val, 1)
+        self.version += 1
+
 class Graph:
     """This is a model of reprentation of a graph, with some relative methods
     Ex: * Case of graphs with weights
@@ -46,6 +252,11 @@ class Graph:
     Rk: If this condition is possible for a given vertex, it is possible for the others, due to the fact that the graph is not oriented
     - Simple graph : graph without loop, and where there is maximum 1 edge between 2 vertices.
     Rk: a such graph can be oriented or not
+
+    NB: 'Vertices' and 'Edges' are copied in a 'VertexSet' and an 'EdgeDict', so that the structural properties of the graph (self.isSimple(), self.isConnected(), ...) are computed only once between 2 modifications
+        Thus, modifying the set or the dict given to Graph() (or assigned to G.Vertices and G.Edges) doesn't modify the graph : G.Vertices and G.Edges must be modified instead
+        Rk: since the version 0.1.0. Until the version 0.0.1, the given set and dict were directly used by the graph
+        The lists of weights are stored in 'WeightList', so that they can be modified in place (ex: G.Edges[Edge].append(2))
     """
 
     def __init__(self, Vertices:set = set(), Edges:dict = {}, name:str = 'G'):
@@ -54,6 +265,28 @@ class Graph:
         self.name = name
         self.isGraph()
 
+    @property
+    def Vertices(self)-> VertexSet:
+        return self._Vertices
+
+    @Vertices.setter
+    def Vertices(self, Vertices:set):
+        if Vertices is getattr(self, '_Vertices', None):
+            return #Case of 'G.Vertices |= ...', where self.Vertices has already been modified in place
+        self._Vertices = VertexSet(Vertices)
+        self.Cache = {}
+
+    @property
+    def Edges(self)-> EdgeDict:
+        return self._Edges
+
+    @Edges.setter
+    def Edges(self, Edges:dict):
+        if Edges is getattr(self, '_Edges', None):
+            return #Case of 'G.Edges |= ...', where self.Edges has already been modified in place
+        self._Edges = EdgeDict(Edges)
+        self.Cache = {}
+
     def Adj(self, Vertices:set)-> set:
         """It returns the adjacent vertices to a set of vertices 'Vertices' of a graph self
         A such vertice is directly connected to a vertice of 'Vertices' by an edge
@@ -89,11 +322,142 @@ class Graph:
                 Adj.add(Edge)
         return Adj  
 
+    def adjList(self, notoriented:bool = True)-> dict:
+        """It returns the adjacency lists of self in the form of a dict 'vertex: set of its adjacent vertices'
+        If notoriented = True, arcs are considered as non oriented edges. In the opposite case, an arc (vertex, vertex2) only makes 'vertex2' adjacent to 'vertex'
+        Rk: loops are not considered, and it runs in O(len(self.Vertices) + len(self.Edges))
+        """
+        self.isGraph()
+        assert type(notoriented) == bool
+        AdjList = {vertex: set() for vertex in self.Vertices}
+        for Edge in self.Edges:
+            if len(Edge) == 1:
+                continue
+            vertex, vertex2 = Edge
+            AdjList[vertex].add(vertex2)
+            if type(Edge) == fs or notoriented:
+                AdjList[vertex2].add(vertex)
+        return AdjList
+
+    def cache(self, name:str, compute):
+        """It returns the structural property 'name' of self, which is computed with 'compute()' only if self has been modified since its last computation
+        The modifications of self are followed with the versions of self.Vertices and self.Edges
+        """
+        version = (self.Vertices.version, self.Edges.version)
+        if self.Cache.get('version') != version:
+            self.Cache = {'version': version}
+        if name not in self.Cache:
+            self.Cache[name] = compute()
+        return self.Cache[name]
+
     def connectedParts(self)-> list:
         """It returns the indivual connected parts of self in the form of a list
         There are the related parts of the simple version of 'self'"""
         return self.simple().relatedParts()
 
+    def cycleSearch(self)-> tuple:
+        """It searches an eventual cycle (or circuit) of self in a single pass, whatever self is oriented, not oriented or mixed
+        The course follows arcs in their direction and non oriented edges in both directions, without passing 2 times by the same edge
+        The answer is a tuple of the form 'Cycle, Order' where :
+        - 'Cycle' is a found cycle in the form '(vertex, ..., vertex)', or '()' when self has no cycle
+        - 'Order' is a topological order of the vertices of self (each arc goes from a vertex to a following one) when self has no cycle, or '()' else
+        Rk: a loop, or 2 edges between the same 2 vertices, already form a cycle
+        The non oriented edges are first gathered in a spanning forest (DFS), then the arcs are followed between its trees (DFS), so it runs in O(len(self.Vertices) + len(self.Edges))
+        """
+        self.isGraph()
+
+        def search()-> tuple:
+            noWeight = self.isGraphNoWeight(False)
+            Neighbours = {vertex: [] for vertex in self.Vertices} #non oriented edges only
+            Arcs = []
+            for Edge, val in self.Edges.items():
+                if len(Edge) == 1:
+                    vertex = next(iter(Edge))
+                    return (vertex, vertex), ()
+                vertex, vertex2 = Edge
+                if type(Edge) == tuple:
+                    Arcs.append(Edge)
+                elif (val if noWeight else len(val)) > 1:
+                    return (vertex, vertex2, vertex), ()
+                else:
+                    Neighbours[vertex].append(vertex2)
+                    Neighbours[vertex2].append(vertex)
+
+            #We build a spanning forest of the non oriented edges. Each tree is identified by its root
+            Parent, Depth, Root, Members = {}, {}, {}, {}
+
+            def treePath(start, end)-> tuple:
+                """It returns the path going from the vertex 'start' to 'end' in the spanning forest, in the form of a tuple '(start, ..., end)'
+                Rk: 'start' and 'end' must be in the same tree
+                """
+                Path, Path2 = [start], [end]
+                while Depth[start] > Depth[end]:
+                    start = Parent[start]
+                    Path.append(start)
+                while Depth[end] > Depth[start]:
+                    end = Parent[end]
+                    Path2.append(end)
+                while start != end:
+                    start, end = Parent[start], Parent[end]
+                    Path.append(start)
+                    Path2.append(end)
+                Path2.pop()
+                Path2.reverse()
+                return tuple(Path + Path2)
+
+            for root in self.Vertices:
+                if root in Parent:
+                    continue
+                Parent[root], Depth[root], Root[root], Members[root] = None, 0, root, [root]
+                Stack = [root]
+                while Stack:
+                    vertex = Stack.pop()
+                    for vertex2 in Neighbours[vertex]:
+                        if vertex2 not in Parent:
+                            Parent[vertex2], Depth[vertex2], Root[vertex2] = vertex, Depth[vertex]+1, root
+                            Members[root].append(vertex2)
+                            Stack.append(vertex2)
+                        elif vertex2 != Parent[vertex] and Parent[vertex2] != vertex:
+                            return treePath(vertex2, vertex) + (vertex2,), ()
+
+            #Each arc between 2 vertices of the same tree closes a cycle
+            Out = {root: [] for root in Members}
+            for Arc in Arcs:
+                if Root[Arc[0]] == Root[Arc[1]]:
+                    return (Arc[0],) + treePath(Arc[1], Arc[0]), ()
+                Out[Root[Arc[0]]].append(Arc)
+
+            #We follow the arcs between the trees. A tree reached again while in course closes a circuit
+            State = {} #1 : in course, 2 : finished
+            Order = []
+            for root in Out:
+                if root in State:
+                    continue
+                State[root] = 1
+                Stack = [(root, iter(Out[root]), None)] #(tree, its remaining arcs, arc used to reach it)
+                while Stack:
+                    for Arc in Stack[-1][1]:
+                        root2 = Root[Arc[1]]
+                        if root2 not in State:
+                            State[root2] = 1
+                            Stack.append((root2, iter(Out[root2]), Arc))
+                            break
+                        if State[root2] == 1:
+                            k = [tree for tree, _, _ in Stack].index(root2)
+                            CycleArcs = [arc for _, _, arc in Stack[k+1:]] + [Arc]
+                            Cycle = (CycleArcs[0][0],)
+                            for i, arc in enumerate(CycleArcs):
+                                Cycle += treePath(arc[1], CycleArcs[(i+1) % len(CycleArcs)][0])
+                            return Cycle, ()
+                    else:
+                        State[Stack[-1][0]] = 2
+                        Order.append(Stack[-1][0])
+                        Stack.pop()
+            Order.reverse()
+            return (), tuple([vertex for root in Order for vertex in Members[root]])
+
+        return self.cache('cycleSearch', search)
+
     def deg(self, vertex)-> int:
         """It returns the degree of vertex in self
         The degree of a vertex in a graph, is the number of edge ends, that arrive at that vertex
@@ -373,32 +737,80 @@ class Graph:
 
         return self.HamiltonChain() != ()
 
+    def hopDistances(self, sources:set, maxDepth:int = None)-> dict:
+        """It returns the number of edges (hops) of the shortest paths going from the set of vertices 'sources' to the vertices of self, in the form of a dict 'vertex: hops'
+        Arcs are followed in their direction, non oriented edges in both directions, and weights aren't considered. Each vertex of 'sources' is at 0 hop
+        If maxDepth is an int, only the vertices at most at maxDepth hops are returned. The vertices that can't be reached are not in the answer
+        Rk: all sources are explored together with a breadth first search, so it runs in O(len(self.Vertices) + len(self.Edges)) whatever len(sources) is
+        The adjacency lists of self are cached until its next modification, so that repeated calls only cost the course itself
+        NB: 'sources' can also be given as a list, a tuple or a frozenset
+        """
+        assert self.Vertices != set(), "The porblematic graph is empty"
+        assert type(sources) in {set, fs, list, tuple}, f"sources = {sources} must be a set (or a list, a tuple, a frozenset) of vertices"
+        sources = set(sources)
+        assert sources != set() and sources <= self.Vertices, f"sources = {sources} must be a non empty subset of self.Vertices"
+        assert maxDepth is None or (type(maxDepth) == int and maxDepth >= 0), f"maxDepth = {maxDepth} must be None or a positive integer"
+        AdjList = self.cache('adjListOriented', lambda: self.adjList(notoriented = False)) #It is only read, never modified
+        Distances = {vertex: 0 for vertex in sources}
+        ToTest = list(Distances)
+        depth = 0
+        while ToTest != [] and depth != maxDepth:
+            depth += 1
+            Next = []
+            for vertex in ToTest:
+                for vertex2 in AdjList[vertex]:
+                    if vertex2 not in Distances:
+                        Distances[vertex2] = depth
+                        Next.append(vertex2)
+            ToTest = Next
+        return Distances
+
     def isComplete(self)-> bool:
         """It checks if self is complete or not.
         A complete graph is a non oriented graph where each vertex is connected to the others vertices directly by an edge
+        Rk: the edges of self being distinct and between its vertices, it is the case if and only if self has n*(n-1)/2 non oriented edges between 2 different vertices, where n = len(self.Vertices)
         """
         assert self.isNotOriented(), "The problematic graph must be non oriented in order to verify whether it is complete or not."
-        return all([fs({vertex, vertex2}) in self.Edges for vertex in self.Vertices for vertex2 in self.Vertices if vertex != vertex2])
+        n = len(self.Vertices)
+        return self.Edges.nPairs == n*(n-1)//2
 
     def isConnected(self)-> bool:
         """It verifies if self is a connected graph or not
         A connected graph is a graph where it is possible from any vertex, to reach the other vertices following the edges, in its simple version
         """
-        return self.simple().isRelated()
+        self.isGraph()
+        assert self.Vertices != set(), "The porblematic graph is empty"
+
+        def search()-> bool:
+            AdjList = self.adjList()
+            start = next(iter(self.Vertices))
+            Tested = {start}
+            ToTest = [start]
+            while ToTest != []:
+                for vertex in AdjList[ToTest.pop()] - Tested:
+                    Tested.add(vertex)
+                    ToTest.append(vertex)
+            return len(Tested) == len(self.Vertices)
+
+        return self.cache('isConnected', search)
 
     def isForest(self)-> bool:
         """It verifies whether self is a forest or not
         A graph is a forest if and only if all its related parts are trees
+        Rk: it is the case if and only if self has no cycle, what is checked in O(len(self.Vertices) + len(self.Edges)) with self.cycleSearch()
+        NB: as related parts, forests are only defined for non oriented graphs. For oriented or mixed graphs, self.cycleSearch() must be used directly
         """
-        return all([graph.isTree2() for graph in self.relatedParts()])
+        assert self.isNotOriented(), "The problematic graph must be not oriented in order to verify whether it is a forest or not."
+        return self.cycleSearch()[0] == ()
 
     def isGraph(self, error:bool = True):
         """It verifies is a given graph is correct following the modeling format of the class 'Graph'
         It raises an error if error == True and just return a bool, else.
+        Rk: the result is cached until the next modification of self
         """
-        bool1 = all([type(vertex) in {int, str} for vertex in self.Vertices])
-        boolWeight = all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(Weights) == list and Weights != []  and all([type(weight) in Real and weight > 0 for weight in Weights]) and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, Weights in self.Edges.items()])
-        boolNoWeight = all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(n) == int and n > 0 and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, n in self.Edges.items()])
+        bool1 = self.cache('vertices', lambda: all([type(vertex) in {int, str} for vertex in self.Vertices]))
+        boolWeight = self.cache('weight', lambda: all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(Weights) in {list, WeightList} and Weights != []  and all([type(weight) in Real and weight > 0 for weight in Weights]) and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, Weights in self.Edges.items()]))
+        boolNoWeight = self.cache('noWeight', lambda: all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(n) == int and n > 0 and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, n in self.Edges.items()]))
         bool2 = boolWeight or boolNoWeight
         if error == False:
             return bool1 and bool2
@@ -409,8 +821,8 @@ class Graph:
         """It verifies is a given graph is a correct graph with weights following the modeling format of the class 'Graph'
         It raises an error if error == True and just return a bool, else.
         """
-        bool1 = all([type(vertex) in {int, str} for vertex in self.Vertices])
-        bool2 = all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(Weights) == list and Weights != []  and all([type(weight) in Real and weight > 0 for weight in Weights]) and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, Weights in self.Edges.items()])
+        bool1 = self.cache('vertices', lambda: all([type(vertex) in {int, str} for vertex in self.Vertices]))
+        bool2 = self.cache('weight', lambda: all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(Weights) in {list, WeightList} and Weights != []  and all([type(weight) in Real and weight > 0 for weight in Weights]) and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, Weights in self.Edges.items()]))
         if error == False:
             return bool1 and bool2
         assert bool1, f"The structure '{self.Vertices}', containing the vertices of the problematic graph (with weights) has at least one vertex which is neither an int nor a string\n\tRefer to the help of the 'Graph' class"
@@ -420,8 +832,8 @@ class Graph:
         """It verifies is a given graph is a correct graph without weight following the modeling format of the class 'Graph'
         It raises an error if error == True and just return a bool, else.
         """
-        bool1 = all([type(vertex) in {int, str} for vertex in self.Vertices])
-        bool2 = all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(n) == int and n > 0 and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, n in self.Edges.items()])
+        bool1 = self.cache('vertices', lambda: all([type(vertex) in {int, str} for vertex in self.Vertices]))
+        bool2 = self.cache('noWeight', lambda: all([type(Edge) in {fs, tuple} and len(Edge) in {1, 2} and type(n) == int and n > 0 and all([vertex in self.Vertices for vertex in Edge]) and len(set(Edge)) == len(Edge) for Edge, n in self.Edges.items()]))
         if error == False:
             return bool1 and bool2
         assert bool1, f"The structure '{self.Vertices}', containing the vertices of the problematic graph (with weights) has at least one vertex which is neither an int nor a string\n\tRefer to the help of the 'Graph' class"
@@ -433,7 +845,7 @@ class Graph:
         """
         self.isGraph()
         assert self.Vertices != set(), "The porblematic graph is empty"
-        return all([type(Edge) == fs for Edge in self.Edges if len(Edge) == 2])
+        return self.Edges.nArcs == 0
 
     def isOriented(self)-> bool:
         """It verifies wheter the graph 'self' is oriented or not
@@ -441,24 +853,15 @@ class Graph:
         """
         self.isGraph()
         assert self.Vertices != set(), "The porblematic graph is empty"
-        return all([type(Edge) == tuple for Edge in self.Edges if len(Edge) == 2])
+        return self.Edges.nPairs == 0
 
     def isRelated(self)-> bool:
         """It verifies if self is a related graph or not
         A related graph is a non oriented graph where it is possible from any vertex, to reach the other vertices following the edges.
+        Rk: for a non oriented graph, it is the same as being connected
         """
         assert  self.isNotOriented(), "The problematic graph must be not oriented in order to verify whether it is related or not."
-        self = self.simple()
-        start = self.Vertices.pop()
-        Tested = {start}
-        self.Vertices.add(start)
-        ToTest = self.Adj(Tested)
-        while ToTest != set():
-            Tested.update(ToTest)
-            ToTest = self.Adj(Tested)
-        if Tested == self.Vertices:
-            return True
-        return False
+        return self.isConnected()
 
     def isSimple(self)-> bool:
         """It verifies wheter the graph 'self' is simple or not
@@ -466,15 +869,7 @@ class Graph:
         """
         self.isGraph()
         assert self.Vertices != set(), "The porblematic graph is empty"
-        if self.isGraphNoWeight(False):
-            for Edge in self.Edges:
-                if self.Edges[Edge] > 1 or len(Edge) == 1:
-                    return False
-            return True 
-        for Edge in self.Edges:
-            if len(self.Edges[Edge]) > 1 or len(Edge) == 1:
-                return False
-        return True
+        return self.Edges.nLoops == 0 and self.Edges.nMulti == 0
 
     def isStronglyRelated(self)-> bool:
         """It verifies if self is a strongly related graph or not
@@ -495,23 +890,10 @@ class Graph:
     def isTree(self)-> bool:
         """It checks if self is a tree or not
         A tree is a simple related graph without cycle
+        Rk: the absence of cycle is checked in O(len(self.Vertices) + len(self.Edges)) with self.cycleSearch()
         """
         assert self.isSimple() and self.isRelated(), "The problematic graph must be a related and simple graph in order to verify whether it is a tree or not."
-        Edges = self.Edges.copy()
-        start = self.Vertices.pop()
-        Tested = {start}
-        self.Vertices.add(start)
-        l = len(self.Vertices)
-        while len(Tested) < l:
-            for Edge in Edges.copy().items():
-                Edge1 = set(Edge)
-                Inter = Edge1 & Tested
-                if len(Inter) == 2:
-                    return False
-                if len(Inter) == 1: 
-                    Tested.update(Edge1-Inter)
-                    Edges.pop(Edge)
-        return True
+        return self.cycleSearch()[0] == ()
             
     def isTree2(self)-> bool:
         """It checks if self is a tree or not
@@ -521,6 +903,14 @@ class Graph:
         assert self.isSimple() and self.isRelated(), "The problematic graph must be a related and simple graph in order to verify whether it is a tree or not."
         return len(self.Vertices) == len(self.Edges)+1
     
+    def kHopNeighbourhood(self, vertex, k:int)-> set:
+        """It returns the set of the vertices of self, other than 'vertex', that can be reached from 'vertex' following at most k edges
+        Arcs are followed in their direction, as in self.hopDistances()
+        """
+        assert vertex in self.Vertices, f"vertex = {vertex} must be in self.Vertices"
+        assert type(k) == int and k >= 0, f"k = {k} must be a positive integer"
+        return set(self.hopDistances({vertex}, k)) - {vertex}
+
     def Krustal(self):
         """It returns a minimum spanning tree of a graph of weights 'self' using the Krustal algorithm principle
         NB: self must be related and should be simple
@@ -648,7 +1038,7 @@ class Graph:
                     if self.isGraphNoWeight(False):
                         G.Edges[Edge2] += val
                     else:
-                        G.Edges[Edge2].extend(val)
+                        G.Edges[Edge2] = G.Edges[Edge2] + val
                 G.Edges.pop(Edge)
         if not multi:
             for Edge, val in G.Edges.copy().items():
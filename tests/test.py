@@ -17,6 +17,58 @@ print(G.isConnected()) # Returns False
 
 print(G.isSimple()) # Returns False
 
+print(G.cycleSearch()) # Returns one of the cycles of G, and () as G has no topological order
+
+D = Graph({1, 2, 3, 4}, {(1, 2): 1, (2, 3): 1, (1, 3): 1, (3, 4): 1}, "D")
+print(D.cycleSearch()) # Returns ((), (1, 2, 3, 4)) : D has no circuit, and (1, 2, 3, 4) is its topological order
+
+D.Edges[(3, 1)] = 1
+print(D.cycleSearch()) # Returns ((1, 2, 3, 1), ()) : the arc (3, 1) closes a circuit
+
+X = Graph({1, 2, 3, 4}, {(1, 2): 1, fs({2, 3}): 1, (3, 4): 1}, "X") # Mixed graph
+print(X.cycleSearch()) # Returns ((), (1, 2, 3, 4))
+
+X.Edges[fs({4, 1})] = 1
+print(X.cycleSearch()) # Returns ((1, 2, 3, 4, 1), ())
+
+print(G.hopDistances({'A'})) # Outputs the number of edges from 'A' to the vertices it can reach : {'A': 0, 'C': 1, 'D': 2, 'E': 2, 'B': 3, 'F': 3}
+
+print(G.kHopNeighbourhood(3, 2)) # Outputs {1, 2, 4}
+
+# The structural properties are cached, and computed again after each modification of the graph
+Edges = {fs({1, 2}): [1], fs({2, 3}): [2], fs({1, 3}): [4]}
+K = Graph({1, 2, 3}, Edges, "K")
+Edges.pop(fs({1, 3})) # The graph has its own copy of the given edges
+print(K.isComplete(), K.isSimple()) # Returns True True
+
+K.Vertices.add(4)
+print(K.isConnected(), K.isComplete()) # Returns False False
+
+K.Edges[fs({3, 4})] = [1]
+print(K.isConnected(), K.isTree2()) # Returns True False
+
+K.Edges.pop(fs({1, 3}))
+print(K.isTree(), K.isTree2()) # Returns True True
+
+K.Edges |= {(4, 1): [3]}
+print(K.isNotOriented(), K.isOriented(), K.cycleSearch()[0] != ()) # Returns False False True
+
+K.Edges[(4, 1)] = [3, 5] # Overwriting an edge updates the counters of K.Edges
+print(K.Edges.nArcs, K.Edges.nMulti, K.Edges.nPairs) # Outputs 1 1 3
+
+K.Edges[fs({1, 2})].append(3) # Lists of weights can also be modified in place
+print(K.isSimple(), K.Edges.nMulti) # Outputs False 2
+
+M = Graph({1, 2}, {fs({1, 2}): [1], (1, 2): [2]}, "M")
+print(M.simple(multi = True).Edges, M.Edges[fs({1, 2})]) # Outputs {frozenset({1, 2}): [1, 2]} [1], as M.simple() doesn't modify M
+
+K.Edges = {fs({1, 2}): [1], fs({2, 3}): [2], fs({1, 3}): [4]}
+K.Vertices -= {4}
+print(K.isComplete(), K.isConnected()) # Returns True True
+
+K.Vertices = {1, 2, 3, 5}
+print(K.isConnected()) # Returns False
+
 
 """Some examples of graphs for tests
 G = Graph({'A', 'B', 'C', 'D', 'E', 'F', 1, 2, 3, 4}, {fs(('C', 'A')): [1], fs({'B', 'D'}): [3], fs({'B', 'F'}): [2, 4], fs({'C', 'D'}): [2], fs({'C', 'E'}): [50], fs({'D', 'E'}): [100], fs({'E'}): [8], fs({'E', 'F'}): [10], (1, 2): [5], fs({1, 3}): [2], (4, 2): [3], (3, 4): [1]})